@@ -1,5 +1,8 @@
+import copy
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import List, Dict, Set
 from typing import Optional, Union, Any, Literal
 from abc import ABC, abstractmethod
@@ -23,6 +26,200 @@ __all__ = ['SECHTMLParser', 'Document', 'DocumentNode', 'StyleInfo']
 # Define unit types for type checking
 UnitType = Literal['pt', 'px', 'in', 'cm', 'mm', '%']
 
+# SEC filings reuse a small set of inline style strings, so parsed styles are
+# cached by the raw string. Cached entries are templates - callers get a copy
+# since StyleInfo instances can be mutated after parsing.
+_STYLE_CACHE: Dict[str, 'StyleInfo'] = {}
+_STYLE_CACHE_MAX = 4096
+
+# Matches a CSS dimension value like "10pt", "1.5em" or "-4px"
+_DIM_RE = re.compile(r'(-?\d*\.?\d+)([a-z]*)')
+
+# Whitespace normalization patterns used on every text block
+_MULTI_SPACE_RE = re.compile(r' +')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# HTML entities replaced during text cleanup, applied in a single regex pass
+_CLEAN_TEXT_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&apos;': "'",
+    '&#8202;': ' ',  # hair space
+    '&#8203;': ''  # zero-width space
+}
+_CLEAN_TEXT_ENTITY_RE = re.compile('|'.join(re.escape(entity) for entity in _CLEAN_TEXT_ENTITIES))
+
+# The same entities arrive as literal characters once bs4 has decoded them;
+# these single-codepoint cases go through one str.translate pass
+_CLEAN_TEXT_CHAR_TABLE = str.maketrans({
+    '\xa0': ' ',  # non-breaking space
+    '\u200a': ' ',  # hair space
+    '\u200b': ''  # zero-width space
+})
+
+# Map of HTML entities to their markdown-safe replacements, used for table
+# cell text. Built once at import instead of inside the cell loop.
+_TABLE_ENTITY_REPLACEMENTS = {
+    '&horbar;': '-----',  # Horizontal bar
+    '&mdash;': '-----',  # Em dash
+    '&ndash;': '---',  # En dash
+    '&minus;': '-',  # Minus sign
+    '&hyphen;': '-',  # Hyphen
+    '&dash;': '-',  # Generic dash
+    # Add other common entities that might need replacement
+    '&nbsp;': ' ',  # Non-breaking space
+    '&amp;': '&',  # Ampersand
+    '&lt;': '<',  # Less than
+    '&gt;': '>',  # Greater than
+    '&quot;': '"',  # Quote
+    '&apos;': "'",  # Apostrophe
+    '&#8202;': ' ',  # Hair space
+    '&#8203;': '',  # Zero-width space
+    '&#x2014;': '-----',  # Another way to encode mdash
+    '&#x2013;': '---',  # Another way to encode ndash
+    '&#x2212;': '-',  # Another way to encode minus
+}
+
+# Numeric entities that represent dashes, by decimal codepoint
+_DASH_CODEPOINTS = {
+    '8208': '-',  # hyphen
+    '8209': '-',  # non-breaking hyphen
+    '8210': '-',  # figure dash
+    '8211': '---',  # en dash
+    '8212': '-----',  # em dash
+    '8213': '-----',  # horizontal bar
+    '8722': '-',  # minus sign
+}
+
+
+# Combined lookup covering named entities plus the decimal and hexadecimal
+# forms of the dash codepoints, replaced in a single regex pass
+_TABLE_ENTITY_MAP = {
+    **_TABLE_ENTITY_REPLACEMENTS,
+    **{f'&#{code};': replacement for code, replacement in _DASH_CODEPOINTS.items()},
+    **{f'&#x{hex(int(code))[2:]};': replacement for code, replacement in _DASH_CODEPOINTS.items()},
+}
+_TABLE_ENTITY_RE = re.compile('|'.join(re.escape(entity) for entity in _TABLE_ENTITY_MAP))
+
+
+def _replace_html_entities(text: str) -> str:
+    """Replace HTML entities with markdown-safe alternatives"""
+    if '&' not in text:
+        return text
+    return _TABLE_ENTITY_RE.sub(lambda m: _TABLE_ENTITY_MAP[m.group()], text)
+
+
+# CSS text-align values mapped to rich justify values
+_ALIGN_MAP = {
+    'center': 'center',
+    'right': 'right',
+    'justify': 'full',
+    'left': 'left'
+}
+
+# font-weight values treated as bold
+_BOLD_WEIGHTS = frozenset(('bold', '700', '800', '900'))
+
+# Tag-name sets used in hot membership tests
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+_INLINE_TEXT_TAGS = frozenset(('span', 'font', 'strong', 'em', 'b', 'i', 'a'))
+_BLOCK_ELEMENTS = frozenset((
+    'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'blockquote', 'pre', 'hr',
+    'table', 'form', 'fieldset', 'address'
+))
+_INLINE_ELEMENTS = frozenset((
+    'span', 'font', 'b', 'strong', 'i', 'em', 'a',
+    'sub', 'sup', 'u', 'small', 'mark'
+))
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 the node classes fall back
+# to regular dict-based dataclasses
+_SLOTS_KWARGS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Pixel conversion factors for width comparisons (approximate)
+_PX_PER_UNIT = {
+    'px': 1,
+    'pt': 1.333,  # 1pt ≈ 1.333px
+    'in': 96,  # 1in = 96px
+    'cm': 37.795,  # 1cm ≈ 37.795px
+    'mm': 3.7795,  # 1mm ≈ 3.7795px
+    '%': 1  # Handle percentages separately
+}
+
+
+def _to_pixels(width: 'Width') -> float:
+    """Convert width to pixels for comparison"""
+    return width.value * _PX_PER_UNIT.get(width.unit, 1)
+
+
+def _merge_block_styles(style1: 'StyleInfo', style2: 'StyleInfo') -> Optional['StyleInfo']:
+    """Merge the styles of two adjacent text blocks, or None if they conflict"""
+    # If alignment differs the blocks cannot be merged at all; check before
+    # doing any other work
+    if style1.text_align != style2.text_align:
+        return None
+
+    # For font properties, prefer the second node's style if it's different.
+    # This preserves intentional style changes in the second block
+    if style2.font_size and style2.font_size != style1.font_size:
+        font_size = style2.font_size
+    else:
+        font_size = style1.font_size
+
+    if style2.font_weight and style2.font_weight != style1.font_weight:
+        font_weight = style2.font_weight
+    else:
+        font_weight = style1.font_weight
+
+    if style1.width and style2.width:
+        # If units differ, compare in pixels; either way, when one width is
+        # significantly smaller (like a bullet point) use the larger width,
+        # otherwise prefer the second node's width
+        if style1.width.unit != style2.width.unit:
+            w1, w2 = _to_pixels(style1.width), _to_pixels(style2.width)
+        else:
+            w1, w2 = style1.width.value, style2.width.value
+
+        if w1 < w2 * 0.3:  # First node is much smaller
+            width = style2.width
+        elif w2 < w1 * 0.3:  # Second node is much smaller
+            width = style1.width
+        else:
+            # Widths are comparable, use the second node's width
+            width = style2.width
+    else:
+        # If only one has width, use that
+        width = style2.width or style1.width
+
+    # Assemble the merged style in a single constructor call
+    return StyleInfo(
+        display=style2.display or style1.display,
+        margin_top=style1.margin_top,  # Keep first node's top margin
+        margin_bottom=style2.margin_bottom,  # Keep second node's bottom margin
+        font_size=font_size,
+        font_weight=font_weight,
+        text_align=style1.text_align,
+        line_height=style2.line_height or style1.line_height,
+        width=width,
+        text_decoration=style2.text_decoration or style1.text_decoration
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Reuse one TextWrapper per width - textwrap.wrap builds a new one per call"""
+    return textwrap.TextWrapper(
+        width=width,
+        break_long_words=True,
+        break_on_hyphens=True,
+        expand_tabs=True
+    )
+
 
 
 @dataclass
@@ -82,38 +279,12 @@ class StyleInfo:
         if not parent_style:
             return self
 
-        # Create new style with parent values
-        merged = StyleInfo(
-            display=parent_style.display,
-            margin_top=parent_style.margin_top,
-            margin_bottom=parent_style.margin_bottom,
-            font_size=parent_style.font_size,
-            font_weight=parent_style.font_weight,
-            text_align=parent_style.text_align,
-            line_height=parent_style.line_height,
-            width=parent_style.width,
-            text_decoration=parent_style.text_decoration
-        )
-
-        # Override with child values where they exist
-        if self.display is not None:
-            merged.display = self.display
-        if self.margin_top is not None:
-            merged.margin_top = self.margin_top
-        if self.margin_bottom is not None:
-            merged.margin_bottom = self.margin_bottom
-        if self.font_size is not None:
-            merged.font_size = self.font_size
-        if self.font_weight is not None:
-            merged.font_weight = self.font_weight
-        if self.text_align is not None:
-            merged.text_align = self.text_align
-        if self.line_height is not None:
-            merged.line_height = self.line_height
-        if self.width is not None:
-            merged.width = self.width
-        if self.text_decoration is not None:
-            merged.text_decoration = self.text_decoration
+        # Start from the parent values, then override with child values where set
+        merged = copy.copy(parent_style)
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if value is not None:
+                setattr(merged, name, value)
 
         return merged
 
@@ -125,11 +296,9 @@ class StyleInfo:
 
 
 class BaseNode(ABC):
-
     """Abstract base class for all document nodes with metadata support"""
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = ()
 
-    """Abstract base class for all document nodes"""
     @abstractmethod
     def render(self, console_width: int) -> RenderResult:
         """Render the node for display"""
@@ -155,7 +324,7 @@ class BaseNode(ABC):
 
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class HeadingNode(BaseNode):
     content: str
     style: StyleInfo
@@ -222,7 +391,7 @@ class HeadingNode(BaseNode):
         )
 
 
-@dataclass
+@dataclass(**_SLOTS_KWARGS)
 class TextBlockNode(BaseNode):
     content: str
     style: StyleInfo
@@ -247,20 +416,15 @@ class TextBlockNode(BaseNode):
             if len(line) <= width:
                 return [line]
 
-            wrapped = textwrap.wrap(
-                line,
-                width=width,
-                break_long_words=True,
-                break_on_hyphens=True,
-                expand_tabs=True
-            )
+            wrapped = _get_text_wrapper(width).wrap(line)
 
-            # Handle orphaned words
+            # Handle orphaned words in a single pass
             processed = []
             i = 0
-            while i < len(wrapped):
+            n_wrapped = len(wrapped)
+            while i < n_wrapped:
                 current_line = wrapped[i]
-                if i < len(wrapped) - 1:
+                if i < n_wrapped - 1:
                     next_line = wrapped[i + 1]
                     if len(next_line) < width * 0.2 or ' ' not in next_line.strip():
                         combined = current_line + ' ' + next_line
@@ -272,28 +436,20 @@ class TextBlockNode(BaseNode):
                 i += 1
             return processed
 
-        lines = self.content.splitlines(keepends=False)
+        # splitlines() already drops the newline characters, so each line can
+        # feed the wrapper directly
         rendered_lines = []
-        for line in lines:
-            wrapped_lines = wrap_line(line.rstrip('\n'))
-            rendered_lines.extend(wrapped_lines)
-            if line.endswith('\n'):
-                rendered_lines.append('')
+        for line in self.content.splitlines():
+            rendered_lines.extend(wrap_line(line))
 
         final_text = '\n'.join(rendered_lines)
         result = Text(final_text)
 
         if self.style:
             if self.style.text_align:
-                align_map = {
-                    'center': 'center',
-                    'right': 'right',
-                    'justify': 'full',
-                    'left': 'left'
-                }
-                result.justify = align_map.get(self.style.text_align, 'left')
+                result.justify = _ALIGN_MAP.get(self.style.text_align, 'left')
 
-            if self.style.font_weight in ('bold', '700', '800', '900'):
+            if self.style.font_weight in _BOLD_WEIGHTS:
                 result.stylize("bold")
 
         return result
@@ -314,12 +470,27 @@ class TableRow:
     cells: List[TableCell]
     is_header: bool = False
 
-    @property
+    @cached_property
     def virtual_columns(self):
+        # Cells are fully built before the row is constructed, so the span
+        # count can be computed once and cached
         return sum(cell.colspan for cell in self.cells)
 
 
-@dataclass
+# TableProcessor cannot be imported at module top because edgar.files.tables
+# itself imports from this module; bind it once on first table render instead
+_table_processor = None
+
+
+def _get_table_processor():
+    global _table_processor
+    if _table_processor is None:
+        from edgar.files.tables import TableProcessor
+        _table_processor = TableProcessor
+    return _table_processor
+
+
+@dataclass(**_SLOTS_KWARGS)
 class TableNode(BaseNode):
     content: List[TableRow]
     style: StyleInfo
@@ -330,8 +501,7 @@ class TableNode(BaseNode):
         return 'table'
 
     def render(self, console_width: int) -> RenderResult:
-        from edgar.files.tables import TableProcessor
-        processed_table = TableProcessor.process_table(self)
+        processed_table = _get_table_processor().process_table(self)
         if not processed_table:
             return None
 
@@ -483,12 +653,53 @@ class StyledText:
     is_paragraph: bool = False  # Track if this came from a <p> tag
 
 
+@lru_cache(maxsize=256)
+def _header_style_hints(font_weight: Optional[str],
+                        margin_top: Optional[float],
+                        font_size: Optional[float],
+                        base_font_size: float) -> tuple:
+    """Style-derived heading hints: (is_bold, has_top_margin, is_larger_font)"""
+    return (
+        bool(font_weight and font_weight in _BOLD_WEIGHTS),
+        bool(margin_top and margin_top > 18),
+        bool(font_size and font_size >= 1.2 * base_font_size)
+    )
+
+
+@lru_cache(maxsize=256)
+def _heading_level_for(font_size: Optional[float],
+                       font_weight: Optional[str],
+                       base_font_size: float) -> int:
+    """Determine heading level from a style signature"""
+    # Use font size relative to base size to determine level
+    if font_size:
+        size_ratio = font_size / base_font_size
+        if size_ratio >= 1.8:  # Much larger
+            return 1
+        elif size_ratio >= 1.4:  # Notably larger
+            return 2
+        elif size_ratio >= 1.2:  # Somewhat larger
+            return 3
+
+    # If bold but not significantly larger, treat as lower-level heading
+    if font_weight in _BOLD_WEIGHTS:
+        return 3
+
+    return 4  # Default to lowest level if uncertain
+
+
 class SECHTMLParser:
     def __init__(self, root: Tag, extract_data: bool = True):
         self.data:DocumentData = HtmlDocument.extract_data(root) if extract_data else None
         self.root:Tag = clean_html_root(root)
         self.base_font_size = 10.0  # Default base font size in pt
         self.style_stack: List[StyleInfo] = []
+        # get_text results cached by tag identity; heading heuristics ask for
+        # the same element's text repeatedly
+        self._text_cache: Dict[int, str] = {}
+        # _get_text_with_spacing results, also by tag identity - the same
+        # subtree can be visited from several processing paths
+        self._spacing_text_cache: Dict[int, str] = {}
 
     def parse(self) -> Optional[Document]:
         body = self.root.find('body')
@@ -496,9 +707,38 @@ class SECHTMLParser:
             logger.warn("No body tag found in HTML")
             return None
 
+        self._mark_table_ancestors(body)
         nodes = self._parse_element(body)
         return Document(nodes=nodes)
 
+    def _element_text(self, element: Tag) -> str:
+        """Stripped text content of an element, cached by tag identity"""
+        key = id(element)
+        text = self._text_cache.get(key)
+        if text is None:
+            text = element.get_text(strip=True)
+            self._text_cache[key] = text
+        return text
+
+    @staticmethod
+    def _mark_table_ancestors(element: Tag) -> None:
+        """Mark every ancestor of a table so div processing can preserve structure"""
+        for table in element.find_all('table'):
+            parent = table.parent
+            while parent and not parent.get('has_table'):
+                parent['has_table'] = True
+                parent = parent.parent
+
+    @staticmethod
+    def _extend_nodes(nodes: List[BaseNode], result: Optional[Union[BaseNode, List[BaseNode]]]) -> None:
+        """Append a processing result to nodes, flattening lists and dropping None"""
+        if result is None:
+            return
+        if isinstance(result, list):
+            nodes.extend(result)
+        else:
+            nodes.append(result)
+
     def _parse_element(self, element: Tag) -> List[BaseNode]:
         nodes = []
 
@@ -506,14 +746,25 @@ class SECHTMLParser:
             if not isinstance(child, Tag):
                 continue
 
-            node = self._process_element(child)
-            if node:
-                nodes.extend(node if isinstance(node, list) else [node])
+            self._extend_nodes(nodes, self._process_element(child))
 
         return self._merge_adjacent_nodes(nodes)
 
     def parse_style(self, style_str: str) -> StyleInfo:
         """Parse inline CSS style string into StyleInfo object"""
+        if not style_str:
+            return StyleInfo()
+        template = _STYLE_CACHE.get(style_str)
+        if template is None:
+            template = self._parse_style_string(style_str)
+            if len(_STYLE_CACHE) < _STYLE_CACHE_MAX:
+                # Intern the key so repeated lookups of the same style string
+                # compare by identity before falling back to a full compare
+                _STYLE_CACHE[sys.intern(style_str)] = template
+        return copy.copy(template)
+
+    def _parse_style_string(self, style_str: str) -> StyleInfo:
+        """Parse an inline CSS style string without consulting the cache"""
         style = StyleInfo()
         if not style_str:
             return style
@@ -552,7 +803,9 @@ class SECHTMLParser:
 
         return style
 
-    def _parse_width(self, value: str) -> Optional[Width]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_width(value: str) -> Optional[Width]:
         """Parse CSS width value into Width object"""
         if not value:
             return None
@@ -565,7 +818,7 @@ class SECHTMLParser:
                 return None
 
         # Extract number and unit
-        match = re.match(r'(-?\d*\.?\d+)([a-z]*)', value)
+        match = _DIM_RE.match(value)
         if not match:
             return None
 
@@ -592,7 +845,9 @@ class SECHTMLParser:
         return Width(number, unit)
 
 
-    def _parse_unit(self, value: str) -> Optional[float]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_unit(value: str) -> Optional[float]:
         """Parse CSS unit values into integer character width"""
         if not value:
             return None
@@ -605,7 +860,7 @@ class SECHTMLParser:
                 return None
 
         # Extract number and unit
-        match = re.match(r'(-?\d*\.?\d+)([a-z]*)', value)
+        match = _DIM_RE.match(value)
         if not match:
             return None
 
@@ -635,20 +890,15 @@ class SECHTMLParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content while preserving meaningful whitespace"""
-        # Replace HTML entities
-        entities = {
-            '&nbsp;': ' ',
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&apos;': "'",
-            '&#8202;': ' ',  # hair space
-            '&#8203;': ''  # zero-width space
-        }
+        if not text:
+            return text
+
+        # Replace HTML entities in a single pass
+        if '&' in text:
+            text = _CLEAN_TEXT_ENTITY_RE.sub(lambda m: _CLEAN_TEXT_ENTITIES[m.group()], text)
 
-        for entity, replacement in entities.items():
-            text = text.replace(entity, replacement)
+        # Replace already-decoded entity characters with a translate pass
+        text = text.translate(_CLEAN_TEXT_CHAR_TABLE)
 
         # Normalize whitespace while preserving single newlines
         lines = text.splitlines()
@@ -664,19 +914,25 @@ class SECHTMLParser:
             return False
 
         # Get text content
-        text = element.get_text(strip=True)
+        text = self._element_text(element)
         if not text:
             return False
 
+        # Style-derived hints are cached per style signature since the same
+        # inline styles repeat across a filing
+        is_bold, has_margin, is_larger = _header_style_hints(
+            style.font_weight, style.margin_top, style.font_size, self.base_font_size
+        )
+
         # More strict header characteristics
         hints = [
-            bool(style.font_weight and style.font_weight in ['bold', '700', '800', '900']),  # Bold text
-            bool(style.margin_top and style.margin_top > 18),  # Significant top margin
+            is_bold,  # Bold text
+            has_margin,  # Significant top margin
             bool(len(text.split()) <= 8),  # Very short text (reduced from 10)
             not bool(element.find('table')),  # No tables inside
-            not any(c.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p'] for c in element.find_all()),
+            element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']) is None,
             # No header or paragraph tags inside
-            bool(style.font_size and style.font_size >= 1.2 * self.base_font_size)  # Notably larger font
+            is_larger  # Notably larger font
         ]
 
         # More strict requirements: need more positive hints
@@ -687,38 +943,18 @@ class SECHTMLParser:
         if not style:
             return 2  # Default level
 
-        # Use font size relative to base size to determine level
-        if style.font_size:
-            size_ratio = style.font_size / self.base_font_size
-            if size_ratio >= 1.8:  # Much larger
-                return 1
-            elif size_ratio >= 1.4:  # Notably larger
-                return 2
-            elif size_ratio >= 1.2:  # Somewhat larger
-                return 3
-
-        # If bold but not significantly larger, treat as lower-level heading
-        if style.font_weight in ['bold', '700', '800', '900']:
-            return 3
-
-        return 4  # Default to lowest level if uncertain
+        return _heading_level_for(style.font_size, style.font_weight, self.base_font_size)
 
     def _process_element(self, element: Tag) -> Optional[Union[BaseNode, List[BaseNode]]]:
         """Process an element into one or more nodes with inherited styles"""
-        # Phase 1: Mark all ancestors of tables
-        tables = element.find_all('table', recursive=True)
-        for table in tables:
-            parent = table.parent
-            while parent:
-                parent['has_table'] = True
-                parent = parent.parent
-
-        # Parse current element's style
-        current_style = self.parse_style(element.get('style', ''))
+        # Snapshot the inherited style once before parsing the element's own
+        parent_style = self.style_stack[-1] if self.style_stack else None
 
-        # Merge with parent style if there is one
-        if self.style_stack:
-            current_style = current_style.merge(self.style_stack[-1])
+        # Parse current element's style and merge with the parent style,
+        # reading the attribute dict directly in this hot path
+        current_style = self.parse_style(element.attrs.get('style', ''))
+        if parent_style is not None:
+            current_style = current_style.merge(parent_style)
 
         # Push current style to stack before processing children
         self.style_stack.append(current_style)
@@ -727,9 +963,9 @@ class SECHTMLParser:
             # Handle ix: tags by processing their content sequentially
             if element.name.startswith('ix:'):
                 nodes = []
-                children = list(element.children)  # Convert to list to avoid iterator modification
 
-                for i, child in enumerate(children):
+                # Children are not modified below, so stream the iterator directly
+                for child in element.children:
                     if isinstance(child, Tag):
                         if child.name == 'table':
                             # Process table
@@ -743,21 +979,11 @@ class SECHTMLParser:
                                 nodes.append(para_node)
                         elif child.name == 'div':
                             # Process div with its own style
-                            div_style = self.parse_style(child.get('style', '')).merge(current_style)
-                            div_result = self._process_structured_content(child, div_style)
-                            if div_result:
-                                if isinstance(div_result, list):
-                                    nodes.extend(div_result)
-                                else:
-                                    nodes.append(div_result)
+                            div_style = self.parse_style(child.attrs.get('style', '')).merge(current_style)
+                            self._extend_nodes(nodes, self._process_structured_content(child, div_style))
                         else:
                             # Process other elements recursively
-                            child_result = self._process_element(child)
-                            if child_result:
-                                if isinstance(child_result, list):
-                                    nodes.extend(child_result)
-                                else:
-                                    nodes.append(child_result)
+                            self._extend_nodes(nodes, self._process_element(child))
 
                 # Return the collected nodes
                 return nodes[0] if len(nodes) == 1 else nodes if nodes else None
@@ -766,11 +992,11 @@ class SECHTMLParser:
             if element.name == 'table':
                 return self._process_table(element)
 
-            elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            elif element.name in _HEADING_TAGS:
                 level = int(element.name[1])
                 return create_node(
                     type_='heading',
-                    content=element.get_text(strip=True),
+                    content=self._element_text(element),
                     style=current_style,
                     level=level
                 )
@@ -791,12 +1017,7 @@ class SECHTMLParser:
             nodes = []
             for child in element.children:
                 if isinstance(child, Tag):
-                    child_result = self._process_element(child)
-                    if child_result:
-                        if isinstance(child_result, list):
-                            nodes.extend(child_result)
-                        else:
-                            nodes.append(child_result)
+                    self._extend_nodes(nodes, self._process_element(child))
 
             return nodes[0] if len(nodes) == 1 else nodes if nodes else None
 
@@ -834,12 +1055,7 @@ class SECHTMLParser:
                 elif child.get('has_table'):
                     # This child contains a table somewhere, process structurally
                     flush_text()
-                    child_result = self._process_element(child)
-                    if child_result:
-                        if isinstance(child_result, list):
-                            nodes.extend(child_result)
-                        else:
-                            nodes.append(child_result)
+                    self._extend_nodes(nodes, self._process_element(child))
                 else:
                     # Non-table-containing element, can process for text
                     text = self._get_text_with_spacing(child).strip()
@@ -853,8 +1069,12 @@ class SECHTMLParser:
         """Process content in content-combining mode (for elements without tables)"""
         nodes = []
         text_parts = []
+        # True while text_parts is non-empty and does not already end in a
+        # newline - saves peeking at the list tail on every separator
+        tail_is_text = False
 
         def flush_text():
+            nonlocal tail_is_text
             if text_parts:
                 text = ' '.join(text_parts).strip()
                 if text:
@@ -864,6 +1084,7 @@ class SECHTMLParser:
                         style=style
                     ))
                 text_parts.clear()
+            tail_is_text = False
 
         # Process children while handling special cases
         for child in element.children:
@@ -871,69 +1092,66 @@ class SECHTMLParser:
                 text = str(child).strip()
                 if text and text != '​':  # Skip zero-width spaces
                     text_parts.append(text)
+                    tail_is_text = True
             elif isinstance(child, Tag):
                 if child.name == 'br':
                     text_parts.append('\n')
+                    tail_is_text = False
                 elif child.name == 'p':
                     # Flush any current text before handling paragraph
                     flush_text()
                     # Process paragraph content
-                    para_style = self.parse_style(child.get('style', '')).merge(style)
+                    para_style = self.parse_style(child.attrs.get('style', '')).merge(style)
                     para_result = self._process_paragraph(child, para_style)
                     if para_result:
                         nodes.append(para_result)
                         # Add newline after paragraph if there isn't one
-                        if text_parts and text_parts[-1] != '\n':
+                        if tail_is_text:
                             text_parts.append('\n')
+                            tail_is_text = False
                 elif child.name == 'font':
                     # Process font tag content
                     text = self._get_text_with_spacing(child).strip()
                     if text:
                         text_parts.append(text)
+                        tail_is_text = True
                 elif child.name == 'div':
+                    # Fetch the style attribute once for both checks below
+                    div_style_attr = child.attrs.get('style', '')
                     # Check for bullet point structure
-                    float_style = self.parse_style(child.get('style', '')).display
+                    float_style = self.parse_style(div_style_attr).display
                     if float_style == 'float:left':
                         # This is a bullet point marker
                         bullet_text = child.get_text().strip()
                         if bullet_text:
                             text_parts.append(bullet_text + ' ')
-                    elif 'clear:both' in child.get('style', ''):
+                            tail_is_text = True
+                    elif 'clear:both' in div_style_attr:
                         # This is a bullet point separator
-                        if text_parts and text_parts[-1] != '\n':
+                        if tail_is_text:
                             text_parts.append('\n')
+                            tail_is_text = False
                     else:
                         # Regular div - process its content
                         inner_result = self._process_inline_content(child, style)
                         if inner_result:
                             # Flush any current text before adding the new content
                             flush_text()
-                            if isinstance(inner_result, list):
-                                nodes.extend(inner_result)
-                            else:
-                                nodes.append(inner_result)
+                            self._extend_nodes(nodes, inner_result)
                 elif not self._is_block_element(child):
                     text = self._get_text_with_spacing(child).strip()
                     if text:
                         text_parts.append(text)
+                        tail_is_text = True
 
         # Flush any remaining text
         flush_text()
 
-        # Return appropriate result based on what we collected
+        # flush_text has already turned any trailing text into a node, so the
+        # collected nodes are the whole result
         if len(nodes) == 1:
             return nodes[0]
-        elif len(nodes) > 1:
-            return nodes
-        elif len(text_parts) > 0:
-            text = ' '.join(text_parts).strip()
-            if text:
-                return create_node(
-                    type_='text_block',
-                    content=text,
-                    style=style
-                )
-        return None
+        return nodes if nodes else None
 
 
 
@@ -959,7 +1177,7 @@ class SECHTMLParser:
 
         # Clean up any potential multiple newlines or spaces
         #text = re.sub(r'\s*\n\s*', '\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
 
         return text.strip()
 
@@ -968,78 +1186,32 @@ class SECHTMLParser:
         if not element:
             return None
 
-        def replace_html_entities(text: str) -> str:
-            """Replace HTML entities with markdown-safe alternatives"""
-            # Map of HTML entities to their markdown-safe replacements
-            entity_replacements = {
-                '&horbar;': '-----',  # Horizontal bar
-                '&mdash;': '-----',  # Em dash
-                '&ndash;': '---',  # En dash
-                '&minus;': '-',  # Minus sign
-                '&hyphen;': '-',  # Hyphen
-                '&dash;': '-',  # Generic dash
-                # Add other common entities that might need replacement
-                '&nbsp;': ' ',  # Non-breaking space
-                '&amp;': '&',  # Ampersand
-                '&lt;': '<',  # Less than
-                '&gt;': '>',  # Greater than
-                '&quot;': '"',  # Quote
-                '&apos;': "'",  # Apostrophe
-                '&#8202;': ' ',  # Hair space
-                '&#8203;': '',  # Zero-width space
-                '&#x2014;': '-----',  # Another way to encode mdash
-                '&#x2013;': '---',  # Another way to encode ndash
-                '&#x2212;': '-',  # Another way to encode minus
-            }
-
-            # Also handle numeric entities that might represent dashes
-            # Unicode values for various dashes
-            dash_codepoints = {
-                '8208': '-',  # hyphen
-                '8209': '-',  # non-breaking hyphen
-                '8210': '-',  # figure dash
-                '8211': '---',  # en dash
-                '8212': '-----',  # em dash
-                '8213': '-----',  # horizontal bar
-                '8722': '-',  # minus sign
-            }
-
-            result = text
-            # Replace named entities
-            for entity, replacement in entity_replacements.items():
-                result = result.replace(entity, replacement)
-
-            # Replace numeric entities (both decimal and hex) for dashes
-            for code, replacement in dash_codepoints.items():
-                # Replace decimal format
-                result = result.replace(f'&#{code};', replacement)
-                # Replace hexadecimal format
-                result = result.replace(f'&#x{hex(int(code))[2:]};', replacement)
-
-            return result
-
         def extract_cell_text(cell: Tag) -> str:
             """Extract text from cell with careful line break handling"""
             # First check for div children
             divs = cell.find_all('div', recursive=False)
             if divs:
                 # Get text from each div and handle entities
-                div_texts = [replace_html_entities(div.get_text(strip=True)) for div in divs]
+                div_texts = [_replace_html_entities(div.get_text(strip=True)) for div in divs]
                 return '\n'.join(div_texts)
 
-            # Handle <br/> tags by replacing them with newlines
-            for br in cell.find_all('br'):
-                br.replace_with('\n')
+            # Collect text nodes directly, treating <br/> as a newline without
+            # mutating the tree the way replace_with did
+            parts = []
+            for descendant in cell.descendants:
+                if isinstance(descendant, NavigableString):
+                    parts.append(str(descendant))
+                elif descendant.name == 'br':
+                    parts.append('\n')
 
-            # Get text and handle entities
-            text = cell.get_text(strip=False)
-            text = replace_html_entities(text)
+            text = _replace_html_entities(''.join(parts))
             return text.strip()
 
         def process_cell(cell: Tag) -> List[TableCell]:
             """Process cell preserving exact colspan and positioning values correctly"""
-            colspan = int(cell.get('colspan', '1'))
-            style = self.parse_style(cell.get('style', ''))
+            attrs = cell.attrs
+            colspan = int(attrs.get('colspan', '1'))
+            style = self.parse_style(attrs.get('style', ''))
 
             text = extract_cell_text(cell)
 
@@ -1068,13 +1240,21 @@ class SECHTMLParser:
             )]
 
 
+        # Identify header rows in one pre-pass rather than walking each row's
+        # ancestor chain with find_parent
+        thead_row_ids = {
+            id(tr)
+            for thead in element.find_all('thead')
+            for tr in thead.find_all('tr')
+        }
+
         def process_row(row: Tag) -> TableRow:
             """Process row preserving cell structure"""
             cells = []
             for td in row.find_all(['td', 'th']):
                 cells.extend(process_cell(td))
 
-            return TableRow(cells=cells, is_header=row.find_parent('thead') is not None)
+            return TableRow(cells=cells, is_header=id(row) in thead_row_ids)
 
         # Process all rows
         rows = []
@@ -1108,22 +1288,27 @@ class SECHTMLParser:
         text_parts = []
         last_was_text = False
 
+        # Bind the hot names once for the tight child loop
+        append = text_parts.append
+        get_spacing = self._get_text_with_spacing
+
         for child in element.children:
             if isinstance(child, NavigableString):
                 text = str(child)
                 if text.strip():
-                    text_parts.append(text)
+                    append(text)
                     last_was_text = True
                 elif text.isspace() and last_was_text:
-                    text_parts.append(' ')
+                    append(' ')
             elif isinstance(child, Tag):
-                if child.name == 'br':
-                    text_parts.append('\n')
+                name = child.name
+                if name == 'br':
+                    append('\n')
                     last_was_text = False
-                elif child.name in ['span', 'font', 'strong', 'em', 'b', 'i', 'a']:
-                    text = self._get_text_with_spacing(child)
-                    if text.strip():
-                        text_parts.append(text.strip())
+                elif name in _INLINE_TEXT_TAGS:
+                    stripped = get_spacing(child).strip()
+                    if stripped:
+                        append(stripped)
                         last_was_text = True
 
         if not text_parts:
@@ -1171,46 +1356,47 @@ class SECHTMLParser:
 
             # Remove any extra empty lines but preserve single line breaks
             text = '\n'.join(lines)
-            return re.sub(r'\n{3,}', '\n\n', text)
+            return _EXTRA_NEWLINES_RE.sub('\n\n', text)
 
     def _is_block_element(self, element: Tag) -> bool:
         """Determine if an element is block-level"""
-        # Check explicit display style first
-        style = self.parse_style(element.get('style', ''))
-        if style.display:
-            return style.display != 'inline'
-
-        # Default block elements
-        block_elements = {
-            'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-            'ul', 'ol', 'li', 'blockquote', 'pre', 'hr',
-            'table', 'form', 'fieldset', 'address'
-        }
+        # Check explicit display style first, skipping the parse entirely for
+        # elements without a style attribute
+        style_attr = element.attrs.get('style', '')
+        if style_attr:
+            display = self.parse_style(style_attr).display
+            if display:
+                return display != 'inline'
 
-        return element.name in block_elements and 'float:left' not in element.get('style', '')
+        return element.name in _BLOCK_ELEMENTS and 'float:left' not in style_attr
 
 
     def _collect_styled_text(self, element: Tag, style: StyleInfo) -> List[StyledText]:
         """Collect text with style information from inline elements"""
         pieces = []
 
-        for child in element.children:
+        # Explicit stack of (node, effective style) pairs, pushed in reverse
+        # so text is emitted in document order without recursion
+        stack = [(child, style) for child in reversed(element.contents)]
+
+        while stack:
+            child, child_style = stack.pop()
             if isinstance(child, NavigableString):
                 text = str(child)
                 if text.strip():
-                    pieces.append(StyledText(text, style))
+                    pieces.append(StyledText(text, child_style))
             elif isinstance(child, Tag):
                 if child.name == 'br':
-                    pieces.append(StyledText('\n', style))
+                    pieces.append(StyledText('\n', child_style))
                 elif child.name != 'table':  # Skip tables in inline collection
-                    child_style = self._get_combined_style(child, style)
-                    pieces.extend(self._collect_styled_text(child, child_style))
+                    combined_style = self._get_combined_style(child, child_style)
+                    stack.extend((grandchild, combined_style) for grandchild in reversed(child.contents))
 
         return pieces
 
     def _get_combined_style(self, element: Tag, parent_style: StyleInfo) -> StyleInfo:
         """Combine element's style with parent style, including HTML attributes"""
-        style = self.parse_style(element.get('style', ''))
+        style = self.parse_style(element.attrs.get('style', ''))
 
         # Handle specific HTML tags and their attributes
         if element.name == 'font':
@@ -1263,34 +1449,22 @@ class SECHTMLParser:
 
     def _normalize_paragraph_text(self, pieces: List[StyledText]) -> str:
         """Normalize text within a paragraph while preserving intentional breaks"""
-        # Join all pieces and split into lines
+        # Join all pieces, then collapse whitespace per line and drop empty
+        # lines in a single pass
         text = ''.join(piece.content for piece in pieces)
-        lines = text.splitlines()
-
-        # Normalize each line individually
-        normalized_lines = []
-        for line in lines:
-            # Collapse whitespace within each line
-            normalized = ' '.join(line.split())
-            if normalized:
-                normalized_lines.append(normalized)
-
-        # Join lines with single newlines
-        return '\n'.join(normalized_lines)
+        return '\n'.join(
+            normalized
+            for line in text.splitlines()
+            if (normalized := ' '.join(line.split()))
+        )
 
     def _is_inline(self, element: Tag) -> bool:
         """Determine if an element should be treated as inline"""
-        style = self.parse_style(element.get('style', ''))
-        if style.display == 'inline':
+        style_attr = element.attrs.get('style', '')
+        if style_attr and self.parse_style(style_attr).display == 'inline':
             return True
 
-        # Standard inline elements
-        inline_elements = {
-            'span', 'font', 'b', 'strong', 'i', 'em', 'a',
-            'sub', 'sup', 'u', 'small', 'mark'
-        }
-
-        return element.name in inline_elements
+        return element.name in _INLINE_ELEMENTS
 
     def _is_empty_text(self, text: str) -> bool:
         """Check if text is effectively empty"""
@@ -1301,130 +1475,78 @@ class SECHTMLParser:
         if element.name == 'table':
             return ''
 
-        texts = []
-        last_was_text = False
-
-        for child in element.children:
-            if isinstance(child, NavigableString):
-                text = str(child)
-                if text.strip():
-                    texts.append(text.strip())
-                    last_was_text = True
-                elif text.isspace() and last_was_text:
+        cached = self._spacing_text_cache.get(id(element))
+        if cached is not None:
+            return cached
+
+        def consume_child_text(frame: list, child_text: str) -> None:
+            """Fold a completed child's text into its parent frame"""
+            stripped = child_text.strip()
+            if stripped:
+                texts = frame[2]
+                # Only add space if needed
+                if texts and frame[3] and not texts[-1].endswith(' ') and not child_text.startswith(' '):
                     texts.append(' ')
-            elif child.name == 'br':
-                texts.append('\n')
-                last_was_text = False
-            elif child.name == 'table':
+                texts.append(stripped)
+                frame[3] = True
+
+        # Explicit stack of [element, child iterator, texts, last_was_text]
+        # frames instead of recursing into every nested tag
+        stack = [[element, iter(element.children), [], False]]
+        result = ''
+
+        while stack:
+            frame = stack[-1]
+            descended = False
+            for child in frame[1]:
+                if isinstance(child, NavigableString):
+                    text = str(child)
+                    stripped = text.strip()
+                    if stripped:
+                        frame[2].append(stripped)
+                        frame[3] = True
+                    elif text.isspace() and frame[3]:
+                        frame[2].append(' ')
+                elif child.name == 'br':
+                    frame[2].append('\n')
+                    frame[3] = False
+                elif child.name == 'table':
+                    continue
+                else:
+                    child_cached = self._spacing_text_cache.get(id(child))
+                    if child_cached is None:
+                        stack.append([child, iter(child.children), [], False])
+                        descended = True
+                        break
+                    consume_child_text(frame, child_cached)
+
+            if descended:
                 continue
-            else:
-                child_text = self._get_text_with_spacing(child)
-                if child_text.strip():
-                    # Only add space if needed
-                    if texts and last_was_text and not texts[-1].endswith(' ') and not child_text.startswith(' '):
-                        texts.append(' ')
-                    texts.append(child_text.strip())
-                    last_was_text = True
 
-        return ''.join(texts)
+            # Frame complete: join its text, cache it, feed the parent frame
+            result = ''.join(frame[2])
+            self._spacing_text_cache[id(frame[0])] = result
+            stack.pop()
+            if stack:
+                consume_child_text(stack[-1], result)
+
+        return result
 
     def _merge_adjacent_nodes(self, nodes: List[BaseNode]) -> List[BaseNode]:
         """Merge adjacent nodes while preserving styling from both nodes"""
         if not nodes:
             return []
 
-        def merge_styles(style1: StyleInfo, style2: StyleInfo) -> StyleInfo:
-            """Merge two styles intelligently"""
-            # Start with a new style object
-            merged = StyleInfo()
-
-            # For each style attribute, take the non-None value
-            # If both have values, use the more specific one
-            merged.display = style2.display or style1.display
-            merged.margin_top = style1.margin_top  # Keep first node's top margin
-            merged.margin_bottom = style2.margin_bottom  # Keep second node's bottom margin
-
-            # For font properties, prefer the second node's style if it's different
-            # This preserves intentional style changes in the second block
-            if style2.font_size and style2.font_size != style1.font_size:
-                merged.font_size = style2.font_size
-            else:
-                merged.font_size = style1.font_size
-
-            if style2.font_weight and style2.font_weight != style1.font_weight:
-                merged.font_weight = style2.font_weight
-            else:
-                merged.font_weight = style1.font_weight
-
-            # For alignment, if they differ, don't merge
-            if style1.text_align != style2.text_align:
-                return None
-            merged.text_align = style1.text_align
-
-            # Improved width handling
-            if style1.width and style2.width:
-                # If units differ, prefer the larger width's unit
-                if style1.width.unit != style2.width.unit:
-                    # Convert both to pixels for comparison
-                    # This is a simplified conversion - you might want to use the existing
-                    # Width.to_chars method for more accurate conversion
-                    w1_px = _to_pixels(style1.width)
-                    w2_px = _to_pixels(style2.width)
-
-                    # If one width is significantly smaller (like a bullet point)
-                    # use the larger width
-                    if w1_px < w2_px * 0.3:  # First node is much smaller
-                        merged.width = style2.width
-                    elif w2_px < w1_px * 0.3:  # Second node is much smaller
-                        merged.width = style1.width
-                    else:
-                        # Widths are comparable, use the second node's width
-                        merged.width = style2.width
-                else:
-                    # Same units, apply the same logic
-                    if style1.width.value < style2.width.value * 0.3:
-                        merged.width = style2.width
-                    elif style2.width.value < style1.width.value * 0.3:
-                        merged.width = style1.width
-                    else:
-                        merged.width = style2.width
-            else:
-                # If only one has width, use that
-                merged.width = style2.width or style1.width
-
-            merged.text_decoration = style2.text_decoration or style1.text_decoration
-            merged.line_height = style2.line_height or style1.line_height
-
-            return merged
-
-        def _to_pixels(width: Width) -> float:
-            """Convert width to pixels for comparison"""
-            # Conversion factors (approximate)
-            conversions = {
-                'px': 1,
-                'pt': 1.333,  # 1pt ≈ 1.333px
-                'in': 96,  # 1in = 96px
-                'cm': 37.795,  # 1cm ≈ 37.795px
-                'mm': 3.7795,  # 1mm ≈ 3.7795px
-                '%': 1  # Handle percentages separately
-            }
-            return width.value * conversions.get(width.unit, 1)
-
-        def can_merge_nodes(node1: BaseNode, node2: BaseNode) -> bool:
-            """Determine if two nodes can be safely merged"""
+        def try_merge_style(node1: BaseNode, node2: BaseNode) -> Optional[StyleInfo]:
+            """Merged style for two safely mergeable text blocks, else None"""
             if node1.type != 'text_block' or node2.type != 'text_block':
-                return False
+                return None
 
             # Don't merge if either has special metadata
             if node1.metadata or node2.metadata:
-                return False
-
-            # Try to merge styles
-            merged_style = merge_styles(node1.style, node2.style)
-            if merged_style is None:
-                return False
+                return None
 
-            return True
+            return _merge_block_styles(node1.style, node2.style)
 
         merged = []
         current = None
@@ -1434,8 +1556,10 @@ class SECHTMLParser:
                 current = node
                 continue
 
-            if can_merge_nodes(current, node):
-                merged_style = merge_styles(current.style, node.style)
+            # The merged style doubles as the can-merge check, so the style
+            # merge runs once per adjacent pair
+            merged_style = try_merge_style(current, node)
+            if merged_style is not None:
                 # Create new merged text block with the combined style
                 merged_content = f"{current.content}\n\n{node.content}"
                 current = create_node(
@@ -1463,10 +1587,10 @@ class SECHTMLParser:
         is_larger = (style.font_size or 0) > self.base_font_size
 
         # Check font weight
-        is_bold = style.font_weight in ['bold', '700', '800', '900']
+        is_bold = style.font_weight in _BOLD_WEIGHTS
 
         # Check content length
-        text = element.get_text(strip=True)
+        text = self._element_text(element)
         is_short = len(text) < 200  # Arbitrary threshold
 
         # Combined heuristics
@@ -26,7 +26,7 @@ class TableProcessor:
 
         # Process all rows into virtual columns
         virtual_rows = []
-        max_cols = max(sum(cell.colspan for cell in row.cells) for row in node.content)
+        max_cols = max(row.virtual_columns for row in node.content)
 
         # Convert all rows to virtual columns first
         for row in node.content: